@@ -10,22 +10,263 @@ This technical content is based on patented technology filed by Ucaretron Inc.
 All rights reserved by Ucaretron Inc.
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import copy
 import json
+import queue
+import threading
 import time
 import datetime
+import functools
 import logging
+import logging.handlers
+from enum import IntEnum
+from typing import NamedTuple
+
+# orjson serializes several times faster than stdlib json and emits bytes
+# directly; fall back to stdlib json where it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("system.log"),
-        logging.StreamHandler()
-    ]
+# Handlers sit behind a queue so hot-path logging calls only enqueue the
+# record; a listener thread formats and writes off the caller's thread.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+class _BufferedLogHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to the underlying buffer
+
+    StreamHandler.emit flushes after every record, which would defeat
+    the 64KB file buffer below; skip the per-record flush and flush the
+    stream on close (run by logging.shutdown at exit) so writes batch.
+    """
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self.stream and not self.stream.closed:
+            self.stream.flush()
+        logging.StreamHandler.close(self)
+
+
+_file_handler = _BufferedLogHandler(open("system.log", "a", buffering=65536))
+_file_handler.setFormatter(_log_formatter)
+
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Configure the root logger directly rather than via basicConfig, which
+# would attach its default formatter to the QueueHandler and pre-format
+# records before the listener's handlers format them again.
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
 logger = logging.getLogger("AI-Nutrition-System")
 
+# Timestamp cache for activity stamps (1-second granularity)
+# Sensor streams can hit several methods within the same wall-clock second,
+# so memoize the formatted ISO string instead of rebuilding it on every call.
+_last_ts_sec = [0, ""]
+
+
+def _fmt_iso(t):
+    """Format an epoch timestamp as a UTC ISO-8601 string
+
+    Goes through time.gmtime rather than datetime.now().isoformat(), so
+    formatting skips the local-timezone lookup entirely and the stamps
+    are unambiguous across deployments.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+
+
+def _now_iso():
+    """Return the current time as a UTC ISO string, cached per second"""
+    t = int(time.time())
+    if t != _last_ts_sec[0]:
+        _last_ts_sec[0] = t
+        _last_ts_sec[1] = _fmt_iso(t)
+    return _last_ts_sec[1]
+
+
+class Ok(NamedTuple):
+    """Successful method result
+
+    A two-slot tuple instead of a throwaway {"status": "success", ...}
+    dict; to_dict() restores the legacy dict shape at the boundary.
+    """
+
+    payload: object
+    key: str = "result"
+
+    def to_dict(self):
+        return {"status": "success", self.key: self.payload}
+
+
+class Err(NamedTuple):
+    """Failed method result; to_dict() restores the legacy dict shape"""
+
+    message: str
+
+    def to_dict(self):
+        return {"status": "error", "message": self.message}
+
+
+# Shared rejection response: NamedTuples are immutable, so one instance
+# serves every call made for an unknown user without a fresh allocation.
+_UNREGISTERED = Err("User not registered")
+
+
+def _requires_user(method):
+    """Reject calls for users missing from active_users
+
+    Replaces the membership check duplicated at the top of every
+    per-user method; misses log a warning and return the shared
+    _UNREGISTERED response without running the method body.
+    """
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def wrapper(self, user_id, *args, **kwargs):
+            if user_id not in self.active_users:
+                logger.warning("User %s is not registered", user_id)
+                return _UNREGISTERED
+            return await method(self, user_id, *args, **kwargs)
+    else:
+        @functools.wraps(method)
+        def wrapper(self, user_id, *args, **kwargs):
+            if user_id not in self.active_users:
+                logger.warning("User %s is not registered", user_id)
+                return _UNREGISTERED
+            return method(self, user_id, *args, **kwargs)
+    return wrapper
+
+
+def _log_background_failure(future):
+    """Surface exceptions from fire-and-forget background work
+
+    Futures whose results are never retrieved swallow their exceptions
+    silently, so background submissions attach this as a done-callback.
+    """
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background task failed: %s", exc)
+
+
+# Pre-built report windows: the same three timedeltas are needed on every
+# report request, so build them once instead of per call.
+_REPORT_DELTAS = {
+    "daily": datetime.timedelta(days=0),
+    "weekly": datetime.timedelta(days=7),
+    "monthly": datetime.timedelta(days=30)
+}
+
+
+
+def _dumps(obj, indent=False):
+    """Serialize obj to a JSON string with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+class Comp(IntEnum):
+    """Slot indexes into UserProfile.components
+
+    An IntEnum-indexed list keeps component handles at fixed offsets, so
+    lookups are a list index instead of hashing a string key.
+    """
+
+    SENSOR = 0
+    ANALYZER = 1
+    RECOMMENDER = 2
+    INTAKE = 3
+    UI = 4
+
+
+class UserProfile:
+    """Compact per-user record kept in NutritionSystem.active_users
+
+    Uses __slots__ so each profile is a fixed-layout object instead of a
+    nested dict: attribute access is a C-level slot fetch and per-user
+    memory overhead drops to a fraction of the dict-based layout.
+    """
+
+    __slots__ = ("id", "encrypted_data", "registered_at", "last_activity",
+                 "components", "notify_healthcare_provider")
+
+    def __init__(self, user_id, encrypted_data, notify_healthcare_provider=False):
+        self.id = user_id
+        self.encrypted_data = encrypted_data
+        self.registered_at = _now_iso()
+        self.last_activity = time.time()
+        self.components = [None] * len(Comp)
+        self.notify_healthcare_provider = notify_healthcare_provider
+
+    def touch(self):
+        """Refresh last_activity, coalescing updates within one second
+
+        The stamp is kept as a raw time.time() float and only formatted
+        when a profile is read, so chatty callers cost one float compare
+        per call instead of a string allocation.
+        """
+        now = time.time()
+        if now - self.last_activity > 1.0:
+            self.last_activity = now
+
+
+class _ShardedUserMap:
+    """Backing store for active users, sharded to reduce lock contention
+
+    Records are spread over 16 sub-dicts by user-id hash, each guarded by
+    its own lock, so threads working on different users do not serialize
+    on a single dict and a resize only pauses one shard.
+    """
+
+    _NUM_SHARDS = 16
+
+    __slots__ = ("_shards",)
+
+    def __init__(self):
+        self._shards = [({}, threading.RLock()) for _ in range(self._NUM_SHARDS)]
+
+    def _shard(self, user_id):
+        return self._shards[hash(user_id) & (self._NUM_SHARDS - 1)]
+
+    def __contains__(self, user_id):
+        shard, lock = self._shard(user_id)
+        with lock:
+            return user_id in shard
+
+    def __getitem__(self, user_id):
+        shard, lock = self._shard(user_id)
+        with lock:
+            return shard[user_id]
+
+    def __setitem__(self, user_id, user_profile):
+        shard, lock = self._shard(user_id)
+        with lock:
+            shard[user_id] = user_profile
+
+    def get(self, user_id, default=None):
+        shard, lock = self._shard(user_id)
+        with lock:
+            return shard.get(user_id, default)
+
 
 class NutritionSystem:
     """Main class integrating all components of the AI-based nutrition system"""
@@ -49,10 +290,38 @@ class NutritionSystem:
         self.intake_manager = IntakeManager()
         self.data_security = DataSecurity()
         self.ui_manager = UserInterfaceManager()
+
+        # Shared pool for fanning out independent component calls
+        # (registration, start/stop) instead of running them sequentially
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=6)
+
+        # Pre-resolved bound methods for the per-packet hot paths; each
+        # call site then skips the instance and type attribute lookups
+        self._proc_data = self.sensor_manager.process_data
+        self._analyze = self.nutrition_analyzer.analyze
+        self._recommend = self.supplement_recommender.recommend
+        self._update_schedule = self.intake_manager.update_schedule
+        self._ui_health = self.ui_manager.update_health_data
+        self._ui_supplement = self.ui_manager.update_supplement_data
+        self._ui_intake = self.ui_manager.update_intake_status
         
         # System state
         self.is_running = False
-        self.active_users = {}
+        self.active_users = _ShardedUserMap()
+
+        # Decrypted profile cache so profile reads skip the decrypt step;
+        # entries are written on registration and refreshed on every
+        # profile update, so they never lag the encrypted copy.
+        self._plaintext_cache = {}
+
+        # Cached health reports, keyed by (user_id, report_type, end_date).
+        # The date in the key expires entries when the day rolls over;
+        # writes for a user invalidate that user's entries immediately.
+        self._report_cache = {}
+
+        # Both caches are plain dicts reached from pool threads as well
+        # as callers, so their accesses go through one shared lock.
+        self._cache_lock = threading.Lock()
         
         logger.info("System initialized successfully")
     
@@ -64,13 +333,18 @@ class NutritionSystem:
         
         logger.info("Starting AI-based Nutrition System")
         
-        # Start all components
-        self.sensor_manager.start()
-        self.nutrition_analyzer.start()
-        self.supplement_recommender.start()
-        self.intake_manager.start()
-        self.data_security.start()
-        self.ui_manager.start()
+        # Start all components concurrently; wall time is the slowest
+        # component instead of the sum of all six
+        start_futures = [self._pool.submit(component.start) for component in (
+            self.sensor_manager,
+            self.nutrition_analyzer,
+            self.supplement_recommender,
+            self.intake_manager,
+            self.data_security,
+            self.ui_manager
+        )]
+        for future in start_futures:
+            future.result()
         
         self.is_running = True
         logger.info("System started successfully")
@@ -84,13 +358,17 @@ class NutritionSystem:
         
         logger.info("Stopping AI-based Nutrition System")
         
-        # Stop all components in reverse order
-        self.ui_manager.stop()
-        self.data_security.stop()
-        self.intake_manager.stop()
-        self.supplement_recommender.stop()
-        self.nutrition_analyzer.stop()
-        self.sensor_manager.stop()
+        # Stop all components concurrently, submitted in reverse order
+        stop_futures = [self._pool.submit(component.stop) for component in (
+            self.ui_manager,
+            self.data_security,
+            self.intake_manager,
+            self.supplement_recommender,
+            self.nutrition_analyzer,
+            self.sensor_manager
+        )]
+        for future in stop_futures:
+            future.result()
         
         self.is_running = False
         logger.info("System stopped successfully")
@@ -107,36 +385,41 @@ class NutritionSystem:
             bool: True if registration was successful
         """
         if user_id in self.active_users:
-            logger.warning(f"User {user_id} is already registered")
+            logger.warning("User %s is already registered", user_id)
             return False
         
-        logger.info(f"Registering user {user_id}")
+        logger.debug("Registering user %s", user_id)
         
         # Encrypt sensitive user data
         encrypted_user_data = self.data_security.encrypt_user_data(user_data)
         
         # Create user profile
-        user_profile = {
-            "id": user_id,
-            "encrypted_data": encrypted_user_data,
-            "registered_at": datetime.datetime.now().isoformat(),
-            "last_activity": datetime.datetime.now().isoformat(),
-            "components": {}
+        user_profile = UserProfile(
+            user_id,
+            encrypted_user_data,
+            notify_healthcare_provider=user_data.get("notify_healthcare_provider", False)
+        )
+
+        # Initialize user in each component concurrently
+        register_futures = {
+            Comp.SENSOR: self._pool.submit(self.sensor_manager.register_user, user_id, user_data),
+            Comp.ANALYZER: self._pool.submit(self.nutrition_analyzer.register_user, user_id, user_data),
+            Comp.RECOMMENDER: self._pool.submit(self.supplement_recommender.register_user, user_id, user_data),
+            Comp.INTAKE: self._pool.submit(self.intake_manager.register_user, user_id, user_data),
+            Comp.UI: self._pool.submit(self.ui_manager.register_user, user_id, user_data)
         }
-        
-        # Initialize user in each component
-        user_profile["components"]["sensor"] = self.sensor_manager.register_user(user_id, user_data)
-        user_profile["components"]["analyzer"] = self.nutrition_analyzer.register_user(user_id, user_data)
-        user_profile["components"]["recommender"] = self.supplement_recommender.register_user(user_id, user_data)
-        user_profile["components"]["intake_manager"] = self.intake_manager.register_user(user_id, user_data)
-        user_profile["components"]["ui"] = self.ui_manager.register_user(user_id, user_data)
+        for comp, future in register_futures.items():
+            user_profile.components[comp] = future.result()
         
         # Add user to active users
         self.active_users[user_id] = user_profile
+        with self._cache_lock:
+            self._plaintext_cache[user_id] = copy.deepcopy(user_data)
         
-        logger.info(f"User {user_id} registered successfully")
+        logger.info("User %s registered successfully", user_id)
         return True
     
+    @_requires_user
     def process_sensor_data(self, user_id, sensor_data):
         """Process incoming sensor data
         
@@ -145,39 +428,116 @@ class NutritionSystem:
             sensor_data (dict): Sensor data to process
             
         Returns:
-            dict: Processing result
+            Ok or Err: Processing result
         """
-        if user_id not in self.active_users:
-            logger.warning(f"User {user_id} is not registered")
-            return {"status": "error", "message": "User not registered"}
-        
-        logger.info(f"Processing sensor data for user {user_id}")
+        logger.debug("Processing sensor data for user %s", user_id)
         
         # Update last activity
-        self.active_users[user_id]["last_activity"] = datetime.datetime.now().isoformat()
+        self.active_users[user_id].touch()
+        
+        # New data invalidates any cached reports for this user
+        self._invalidate_report_cache(user_id)
         
         # Process the data through the pipeline
         # 1. Validate and preprocess sensor data
-        validated_data = self.sensor_manager.process_data(user_id, sensor_data)
+        validated_data = self._proc_data(user_id, sensor_data)
         
         # 2. Analyze the data
-        analysis_result = self.nutrition_analyzer.analyze(user_id, validated_data)
+        analysis_result = self._analyze(user_id, validated_data)
         
         # 3. Update recommendations if needed
         if analysis_result.get("update_recommendation", False):
             self.update_recommendations(user_id, analysis_result)
         
-        # 4. Check for health alerts
+        # 4. Check for health alerts, batched per analysis pass
         alerts = analysis_result.get("alerts", [])
-        for alert in alerts:
-            self.handle_health_alert(user_id, alert)
+        if alerts:
+            self.handle_health_alerts(user_id, alerts)
         
         # 5. Update UI
-        self.ui_manager.update_health_data(user_id, analysis_result)
+        self._ui_health(user_id, analysis_result)
+        
+        logger.info("Sensor data processing completed for user %s", user_id)
+        return Ok(analysis_result)
+
+    def process_sensor_data_bytes(self, user_id, raw):
+        """Process a raw JSON-encoded sensor payload
         
-        logger.info(f"Sensor data processing completed for user {user_id}")
-        return {"status": "success", "result": analysis_result}
+        Entry point for transport layers that hold the payload as bytes:
+        decoding and re-encoding happen here with orjson when available,
+        avoiding two stdlib-json passes per request.
+        
+        Args:
+            user_id (str): User's unique identifier
+            raw (bytes): JSON-encoded sensor data
+            
+        Returns:
+            bytes: JSON-encoded processing result
+        """
+        if orjson is not None:
+            result = self.process_sensor_data(user_id, orjson.loads(raw))
+            return orjson.dumps(result.to_dict())
+        result = self.process_sensor_data(user_id, json.loads(raw))
+        return json.dumps(result.to_dict(), default=str).encode()
+
+    @_requires_user
+    async def process_sensor_data_async(self, user_id, sensor_data):
+        """Process incoming sensor data without blocking the event loop
+
+        Mirrors process_sensor_data, but runs the synchronous component
+        calls on the shared pool and pushes the UI update as a background
+        task, so work for the next sample can overlap this sample's UI push.
+
+        Args:
+            user_id (str): User's unique identifier
+            sensor_data (dict): Sensor data to process
+
+        Returns:
+            Ok or Err: Processing result
+        """
+        logger.debug("Processing sensor data for user %s", user_id)
+
+        # Update last activity
+        self.active_users[user_id].touch()
+
+        # New data invalidates any cached reports for this user
+        self._invalidate_report_cache(user_id)
+
+        loop = asyncio.get_running_loop()
+
+        # Process the data through the pipeline
+        # 1. Validate and preprocess sensor data
+        validated_data = await loop.run_in_executor(
+            self._pool, self._proc_data, user_id, sensor_data)
+
+        # 2. Analyze the data
+        analysis_result = await loop.run_in_executor(
+            self._pool, self._analyze, user_id, validated_data)
+
+        # 3. Update recommendations if needed
+        if analysis_result.get("update_recommendation", False):
+            await loop.run_in_executor(
+                self._pool, self.update_recommendations, user_id, analysis_result)
+
+        # 4. Check for health alerts, batched per analysis pass; the
+        # dispatch makes synchronous UI calls, so it runs on the pool
+        # like the other component work instead of blocking the loop
+        alerts = analysis_result.get("alerts", [])
+        if alerts:
+            alert_future = loop.run_in_executor(
+                self._pool, self.handle_health_alerts, user_id, alerts)
+            alert_future.add_done_callback(_log_background_failure)
+
+        # 5. Update UI in the background; its return value is never
+        # consumed, but failures must still surface in the log
+        ui_future = loop.run_in_executor(
+            self._pool, self._ui_health, user_id, analysis_result)
+        ui_future.add_done_callback(_log_background_failure)
+
+        logger.info("Sensor data processing completed for user %s", user_id)
+        return Ok(analysis_result)
     
+    @_requires_user
     def update_recommendations(self, user_id, analysis_result):
         """Update supplement recommendations based on analysis results
         
@@ -186,26 +546,23 @@ class NutritionSystem:
             analysis_result (dict): Analysis results
             
         Returns:
-            dict: Updated recommendations
+            Ok or Err: Updated recommendations
         """
-        if user_id not in self.active_users:
-            logger.warning(f"User {user_id} is not registered")
-            return {"status": "error", "message": "User not registered"}
-        
-        logger.info(f"Updating recommendations for user {user_id}")
+        logger.debug("Updating recommendations for user %s", user_id)
         
         # Generate new recommendations
-        recommendations = self.supplement_recommender.recommend(user_id, analysis_result)
+        recommendations = self._recommend(user_id, analysis_result)
         
         # Update intake management
-        self.intake_manager.update_schedule(user_id, recommendations)
+        self._update_schedule(user_id, recommendations)
         
         # Update UI
-        self.ui_manager.update_supplement_data(user_id, recommendations)
+        self._ui_supplement(user_id, recommendations)
         
-        logger.info(f"Recommendations updated for user {user_id}")
-        return {"status": "success", "recommendations": recommendations}
+        logger.info("Recommendations updated for user %s", user_id)
+        return Ok(recommendations, "recommendations")
     
+    @_requires_user
     def record_supplement_intake(self, user_id, supplement_id, intake_time=None):
         """Record a supplement intake
         
@@ -215,72 +572,93 @@ class NutritionSystem:
             intake_time (datetime, optional): Time of intake
             
         Returns:
-            dict: Intake recording result
+            Ok or Err: Intake recording result
         """
-        if user_id not in self.active_users:
-            logger.warning(f"User {user_id} is not registered")
-            return {"status": "error", "message": "User not registered"}
-        
-        logger.info(f"Recording supplement intake for user {user_id}")
+        logger.debug("Recording supplement intake for user %s", user_id)
         
         # Update last activity
-        self.active_users[user_id]["last_activity"] = datetime.datetime.now().isoformat()
+        self.active_users[user_id].touch()
+        
+        # A new intake invalidates any cached reports for this user
+        self._invalidate_report_cache(user_id)
         
         # Record the intake
         result = self.intake_manager.record_intake(user_id, supplement_id, intake_time)
         
         # Update UI
-        self.ui_manager.update_intake_status(user_id, result)
+        self._ui_intake(user_id, result)
         
-        logger.info(f"Supplement intake recorded for user {user_id}")
-        return {"status": "success", "result": result}
+        logger.info("Supplement intake recorded for user %s", user_id)
+        return Ok(result)
     
     def handle_health_alert(self, user_id, alert):
-        """Handle a health alert
+        """Handle a single health alert
         
         Args:
             user_id (str): User's unique identifier
             alert (dict): Health alert data
             
         Returns:
-            dict: Alert handling result
+            Ok: Alert handling result
+        """
+        return self.handle_health_alerts(user_id, [alert])
+    
+    def handle_health_alerts(self, user_id, alerts):
+        """Handle a batch of health alerts
+        
+        One analysis pass can raise several alerts; handling them together
+        looks up the user once and sends one notification per severity
+        bucket instead of one UI round-trip per alert.
+        
+        Args:
+            user_id (str): User's unique identifier
+            alerts (list): Health alert dicts
+            
+        Returns:
+            Ok: Alert handling result
         """
-        logger.warning(f"Health alert for user {user_id}: {alert.get('message')}")
+        for alert in alerts:
+            logger.warning("Health alert for user %s: %s", user_id, alert.get("message"))
+        
+        user_profile = self.active_users.get(user_id)
         
-        # Determine alert severity
-        severity = alert.get("severity", "medium")
+        # Partition alerts by severity
+        high = [a for a in alerts if a.get("severity", "medium") == "high"]
+        medium = [a for a in alerts if a.get("severity", "medium") == "medium"]
+        low = [a for a in alerts if a.get("severity", "medium") not in ("high", "medium")]
         
-        # Take action based on severity
-        if severity == "high":
+        # Take action based on severity, one call per bucket
+        if high:
             # Immediate notification
-            self.ui_manager.send_urgent_notification(user_id, alert)
+            self.ui_manager.send_urgent_notifications(user_id, high)
             
             # If configured, notify healthcare provider
-            if self.active_users[user_id].get("notify_healthcare_provider", False):
-                self._notify_healthcare_provider(user_id, alert)
+            if user_profile is not None and user_profile.notify_healthcare_provider:
+                self._notify_healthcare_provider(user_id, high)
         
-        elif severity == "medium":
+        if medium:
             # Standard notification
-            self.ui_manager.send_notification(user_id, alert)
+            self.ui_manager.send_notifications(user_id, medium)
         
-        else:  # low
+        if low:
             # Add to report but don't notify
-            self.ui_manager.add_to_health_report(user_id, alert)
+            self.ui_manager.add_to_health_report(user_id, low)
         
-        logger.info(f"Health alert handled for user {user_id}")
-        return {"status": "success", "alert_handled": True}
+        logger.info("Health alerts handled for user %s", user_id)
+        return Ok(len(alerts), "alerts_handled")
     
-    def _notify_healthcare_provider(self, user_id, alert):
-        """Notify healthcare provider about a health alert
+    def _notify_healthcare_provider(self, user_id, alerts):
+        """Notify healthcare provider about health alerts
         
         Args:
             user_id (str): User's unique identifier
-            alert (dict): Health alert data
+            alerts (list): Health alert dicts
         """
         # In a real implementation, this would send a notification to the healthcare provider
         # This is a simplified demonstration
-        logger.info(f"Notifying healthcare provider about alert for user {user_id}")
+        logger.info("Notifying healthcare provider about alerts for user %s", user_id)
     
+    @_requires_user
     def get_user_dashboard(self, user_id):
         """Get the user's dashboard data
         
@@ -288,16 +666,12 @@ class NutritionSystem:
             user_id (str): User's unique identifier
             
         Returns:
-            dict: Dashboard data
+            Ok or Err: Dashboard data
         """
-        if user_id not in self.active_users:
-            logger.warning(f"User {user_id} is not registered")
-            return {"status": "error", "message": "User not registered"}
-        
-        logger.info(f"Getting dashboard for user {user_id}")
+        logger.debug("Getting dashboard for user %s", user_id)
         
         # Update last activity
-        self.active_users[user_id]["last_activity"] = datetime.datetime.now().isoformat()
+        self.active_users[user_id].touch()
         
         # Get health data
         health_data = self.nutrition_analyzer.get_health_data(user_id)
@@ -315,9 +689,10 @@ class NutritionSystem:
             "compliance_data": compliance_data
         }
         
-        logger.info(f"Dashboard data retrieved for user {user_id}")
-        return {"status": "success", "dashboard": dashboard_data}
+        logger.info("Dashboard data retrieved for user %s", user_id)
+        return Ok(dashboard_data, "dashboard")
     
+    @_requires_user
     def get_health_report(self, user_id, report_type="monthly"):
         """Get the user's health report
         
@@ -326,28 +701,30 @@ class NutritionSystem:
             report_type (str): Type of report (daily, weekly, monthly)
             
         Returns:
-            dict: Health report
+            Ok or Err: Health report
         """
-        if user_id not in self.active_users:
-            logger.warning(f"User {user_id} is not registered")
-            return {"status": "error", "message": "User not registered"}
-        
-        logger.info(f"Generating {report_type} health report for user {user_id}")
+        logger.debug("Generating %s health report for user %s", report_type, user_id)
         
         # Update last activity
-        self.active_users[user_id]["last_activity"] = datetime.datetime.now().isoformat()
+        self.active_users[user_id].touch()
         
         # Get date range for the report
         end_date = datetime.datetime.now().date()
-        if report_type == "daily":
-            start_date = end_date
-        elif report_type == "weekly":
-            start_date = end_date - datetime.timedelta(days=7)
-        elif report_type == "monthly":
-            start_date = end_date - datetime.timedelta(days=30)
-        else:
-            return {"status": "error", "message": f"Invalid report type: {report_type}"}
-        
+        report_delta = _REPORT_DELTAS.get(report_type)
+        if report_delta is None:
+            return Err(f"Invalid report type: {report_type}")
+        start_date = end_date - report_delta
+
+        # Serve repeat requests (e.g. dashboard polls) from the cache;
+        # hand out a copy so callers mutating the report cannot poison
+        # later hits
+        cache_key = (user_id, report_type, end_date.isoformat())
+        with self._cache_lock:
+            cached_report = self._report_cache.get(cache_key)
+        if cached_report is not None:
+            logger.debug("Serving cached %s health report for user %s", report_type, user_id)
+            return Ok(copy.deepcopy(cached_report), "report")
+
         # Get health data for the period
         health_data = self.nutrition_analyzer.get_health_data(user_id, start_date, end_date)
         
@@ -366,16 +743,32 @@ class NutritionSystem:
             "report_type": report_type,
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
-            "generated_at": datetime.datetime.now().isoformat(),
+            "generated_at": _now_iso(),
             "health_data": health_data,
             "supplement_data": supplement_data,
             "compliance_data": compliance_data,
             "trends": trends
         }
         
-        logger.info(f"{report_type.capitalize()} health report generated for user {user_id}")
-        return {"status": "success", "report": report}
-    
+        logger.info("%s health report generated for user %s", report_type.capitalize(), user_id)
+        with self._cache_lock:
+            if len(self._report_cache) >= 2048:
+                self._report_cache.clear()
+            self._report_cache[cache_key] = copy.deepcopy(report)
+        return Ok(report, "report")
+
+    def _invalidate_report_cache(self, user_id):
+        """Drop cached health reports for a user after new data arrives
+
+        Args:
+            user_id (str): User's unique identifier
+        """
+        with self._cache_lock:
+            stale_keys = [key for key in self._report_cache if key[0] == user_id]
+            for key in stale_keys:
+                del self._report_cache[key]
+
+    @_requires_user
     def get_user_profile(self, user_id):
         """Get the user's profile data
         
@@ -383,34 +776,38 @@ class NutritionSystem:
             user_id (str): User's unique identifier
             
         Returns:
-            dict: User profile
+            Ok or Err: User profile
         """
-        if user_id not in self.active_users:
-            logger.warning(f"User {user_id} is not registered")
-            return {"status": "error", "message": "User not registered"}
-        
-        logger.info(f"Getting profile for user {user_id}")
+        logger.debug("Getting profile for user %s", user_id)
         
         # Update last activity
-        self.active_users[user_id]["last_activity"] = datetime.datetime.now().isoformat()
-        
-        # Get encrypted user data
-        encrypted_user_data = self.active_users[user_id]["encrypted_data"]
-        
-        # Decrypt user data
-        user_data = self.data_security.decrypt_user_data(encrypted_user_data)
+        self.active_users[user_id].touch()
+        
+        # Serve the plaintext from cache when possible, decrypting only
+        # on a miss; entries cross the cache boundary as deep copies so
+        # callers and the cache never share nested objects
+        with self._cache_lock:
+            cached_data = self._plaintext_cache.get(user_id)
+        if cached_data is not None:
+            user_data = copy.deepcopy(cached_data)
+        else:
+            encrypted_user_data = self.active_users[user_id].encrypted_data
+            user_data = self.data_security.decrypt_user_data(encrypted_user_data)
+            with self._cache_lock:
+                self._plaintext_cache[user_id] = copy.deepcopy(user_data)
         
         # Remove sensitive information
         if "password" in user_data:
             del user_data["password"]
         
         # Add registration and activity information
-        user_data["registered_at"] = self.active_users[user_id]["registered_at"]
-        user_data["last_activity"] = self.active_users[user_id]["last_activity"]
+        user_data["registered_at"] = self.active_users[user_id].registered_at
+        user_data["last_activity"] = _fmt_iso(self.active_users[user_id].last_activity)
         
-        logger.info(f"Profile data retrieved for user {user_id}")
-        return {"status": "success", "profile": user_data}
+        logger.info("Profile data retrieved for user %s", user_id)
+        return Ok(user_data, "profile")
     
+    @_requires_user
     def update_user_profile(self, user_id, update_data):
         """Update the user's profile data
         
@@ -419,32 +816,37 @@ class NutritionSystem:
             update_data (dict): Data to update
             
         Returns:
-            dict: Update result
+            Ok or Err: Update result
         """
-        if user_id not in self.active_users:
-            logger.warning(f"User {user_id} is not registered")
-            return {"status": "error", "message": "User not registered"}
-        
-        logger.info(f"Updating profile for user {user_id}")
+        logger.debug("Updating profile for user %s", user_id)
         
         # Update last activity
-        self.active_users[user_id]["last_activity"] = datetime.datetime.now().isoformat()
+        self.active_users[user_id].touch()
         
-        # Get encrypted user data
-        encrypted_user_data = self.active_users[user_id]["encrypted_data"]
-        
-        # Decrypt user data
-        user_data = self.data_security.decrypt_user_data(encrypted_user_data)
+        # Merge into a copy of the cached plaintext, decrypting only on
+        # a cache miss; the cache entry itself is never mutated in place
+        with self._cache_lock:
+            cached_data = self._plaintext_cache.get(user_id)
+        user_data = copy.deepcopy(cached_data) if cached_data is not None else None
+        if user_data is None:
+            user_data = self.data_security.decrypt_user_data(
+                self.active_users[user_id].encrypted_data)
         
         # Update user data
-        for key, value in update_data.items():
-            user_data[key] = value
+        user_data.update(update_data)
         
         # Encrypt updated user data
         updated_encrypted_data = self.data_security.encrypt_user_data(user_data)
         
         # Update user profile
-        self.active_users[user_id]["encrypted_data"] = updated_encrypted_data
+        self.active_users[user_id].encrypted_data = updated_encrypted_data
+        with self._cache_lock:
+            self._plaintext_cache[user_id] = copy.deepcopy(user_data)
+        
+        # Keep the live alert-routing flag on the profile record in sync
+        if "notify_healthcare_provider" in update_data:
+            self.active_users[user_id].notify_healthcare_provider = bool(
+                update_data["notify_healthcare_provider"])
         
         # Update user in each component as needed
         if update_data.get("update_sensor_settings", False):
@@ -462,8 +864,8 @@ class NutritionSystem:
         if update_data.get("update_ui_settings", False):
             self.ui_manager.update_user_settings(user_id, update_data)
         
-        logger.info(f"Profile updated for user {user_id}")
-        return {"status": "success", "message": "Profile updated successfully"}
+        logger.info("Profile updated for user %s", user_id)
+        return Ok("Profile updated successfully", "message")
 
 
 # Example usage
@@ -516,14 +918,14 @@ def main():
         
         # Get the user's dashboard
         dashboard = nutrition_system.get_user_dashboard(user_id)
-        print(json.dumps(dashboard, indent=2))
+        print(_dumps(dashboard.to_dict(), indent=True))
         
         # Record a supplement intake
         nutrition_system.record_supplement_intake(user_id, "vd001")
         
         # Get a health report
         report = nutrition_system.get_health_report(user_id, "weekly")
-        print(json.dumps(report, indent=2))
+        print(_dumps(report.to_dict(), indent=True))
     
     finally:
         # Stop the system